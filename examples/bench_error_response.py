@@ -0,0 +1,88 @@
+"""Benchmark SanicForm.error_response on a form with many failing fields
+
+Compares against the usual hand-rolled approach: walking the nested
+`form.errors` and passing the result to `sanic.response.json`.
+
+    python examples/bench_error_response.py
+"""
+from timeit import repeat
+
+from sanic import response
+from sanic_wtf import ChainRequestParameters, SanicForm
+from wtforms import FieldList, Form, FormField, StringField
+from wtforms.validators import DataRequired, Length
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+FIELDS = 50
+ENTRIES = 20
+NUMBER = 2000
+
+
+class AddressForm(Form):
+    street = StringField('Street', validators=[DataRequired()])
+    city = StringField('City', validators=[DataRequired()])
+    zip = StringField('Zip', validators=[Length(max=5)])
+
+
+attrs = {
+    'field%d' % i: StringField(validators=[DataRequired(), Length(min=3)])
+    for i in range(FIELDS)
+}
+attrs['address'] = FormField(AddressForm)
+attrs['tags'] = FieldList(
+    StringField(validators=[Length(max=3)]), min_entries=ENTRIES)
+BenchForm = type('BenchForm', (SanicForm,), attrs)
+
+
+def flatten(errors, prefix=''):
+    """Hand-rolled walk over nested `form.errors`"""
+    if isinstance(errors, dict):
+        items = errors.items()
+    else:
+        items = enumerate(errors)
+    flat = {}
+    for key, value in items:
+        name = prefix + ('' if key is None else str(key))
+        if not value:
+            continue
+        if isinstance(value, list) and all(isinstance(v, str) for v in value):
+            flat[name] = value
+        else:
+            flat.update(flatten(value, name + '-'))
+    return flat
+
+
+def hand_rolled(form):
+    return response.json({'errors': flatten(form.errors)}, status=400)
+
+
+def main():
+    formdata = ChainRequestParameters(
+        {'address-zip': ['1234567']},
+        {'tags-%d' % i: ['too long'] for i in range(ENTRIES)})
+    form = BenchForm(formdata=formdata)
+    assert not form.validate()
+
+    cases = [
+        ('hand-rolled form.errors + json()', lambda: hand_rolled(form)),
+        ('error_response()', lambda: form.error_response()),
+    ]
+    if orjson is not None:
+        cases.append((
+            'error_response(dumps=orjson.dumps)',
+            lambda: form.error_response(dumps=orjson.dumps)))
+
+    print('{} failing fields, {} calls, best of 5'.format(
+        len(flatten(form.errors)), NUMBER))
+    for label, func in cases:
+        best = min(repeat(func, number=NUMBER, repeat=5))
+        print('{:<40} {:8.2f} us/call'.format(label, best / NUMBER * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -3,6 +3,8 @@ from collections import ChainMap
 from datetime import timedelta
 from itertools import chain
 
+from sanic.response import json
+from wtforms.fields import FieldList, FormField
 from wtforms.form import Form
 from wtforms.csrf.session import SessionCSRF
 from wtforms.meta import DefaultMeta
@@ -51,6 +53,33 @@ def meta_for_request(request):
     return meta
 
 
+def iter_field_errors(fields):
+    """Yield `(name, errors)` for every failing field in `fields`
+
+    Enclosed forms and field lists are walked recursively, the name yielded
+    is the prefixed one as seen in submitted form data, e.g. `address-city`
+    or `phones-0`.  Errors of an enclosed form itself (its `form_errors`),
+    or of a field list's own validators, are yielded under the name of the
+    `FormField` or `FieldList`, e.g. `address` or `phones`.
+    """
+    for field in fields:
+        if not field.errors:
+            continue
+        if isinstance(field, FormField):
+            if field.form.form_errors:
+                yield field.name, list(field.form.form_errors)
+            yield from iter_field_errors(field.form)
+        elif isinstance(field, FieldList):
+            # entry errors come first as lists or dicts, errors of the
+            # list's own validators are appended as plain strings
+            own = [error for error in field.errors if isinstance(error, str)]
+            if own:
+                yield field.name, own
+            yield from iter_field_errors(field.entries)
+        else:
+            yield field.name, list(field.errors)
+
+
 SUBMIT_VERBS = frozenset({'DELETE', 'PATCH', 'POST', 'PUT'})
 
 
@@ -146,3 +175,26 @@ class SanicForm(Form):
         """Return `True` if this form is submited and all fields verified"""
         request = self.request
         return request and request.method in SUBMIT_VERBS and self.validate()
+
+    def error_response(self, status=400, **kwargs):
+        """Return a JSON `sanic.response` with validation errors of this form
+
+        The payload is flat and stable in shape::
+
+            {"errors": {"name": ["message", ...], ...}, "form_errors": [...]}
+
+        where keys of `errors` are the (prefixed) field names in declaration
+        order, nested `FormField` and `FieldList` errors included (see
+        `iter_field_errors`).  Messages are already translated by WTForms
+        during validation.
+
+        Remaining keyword arguments are passed to `sanic.response.json`.
+        Sanic serializes with `ujson` if installed, otherwise with the
+        standard `json` module; for a faster encoder such as `orjson`, pass
+        `dumps=orjson.dumps` here or set `dumps` of the Sanic application.
+        """
+        payload = {
+            'errors': dict(iter_field_errors(self)),
+            'form_errors': list(self.form_errors),
+        }
+        return json(payload, status=status, **kwargs)
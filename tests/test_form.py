@@ -4,7 +4,8 @@ import os.path
 
 from sanic import response
 from wtforms.validators import DataRequired, Length
-from wtforms import FileField, StringField, SubmitField
+from wtforms import (
+    FieldList, FileField, Form, FormField, StringField, SubmitField)
 
 from sanic_wtf import SanicForm, to_bytes
 
@@ -198,3 +199,58 @@ def test_file_upload(app):
 def test_to_bytes():
     assert isinstance(to_bytes(bytes()), bytes)
     assert isinstance(to_bytes(str()), bytes)
+
+
+def test_error_response(app):
+    app.config['WTF_CSRF_ENABLED'] = False
+
+    class AddressForm(Form):
+        city = StringField('City', validators=[DataRequired()])
+        zip = StringField('Zip', validators=[Length(max=5)])
+
+        def validate(self, extra_validators=None):
+            if not super().validate(extra_validators):
+                return False
+            if self.city.data == self.zip.data:
+                self.form_errors.append('city and zip must differ')
+                return False
+            return True
+
+    class TestForm(SanicForm):
+        msg = StringField('Note', validators=[DataRequired(), Length(max=10)])
+        address = FormField(AddressForm)
+        home = FormField(AddressForm)
+        phones = FieldList(
+            StringField('Phone', validators=[Length(max=3)]), min_entries=2)
+        tags = FieldList(
+            StringField('Tag'), min_entries=1,
+            validators=[Length(min=3, message='need 3 tags')])
+        ok = StringField('Fine')
+
+    @app.route('/', methods=['POST'])
+    async def index(request):
+        form = TestForm(request)
+        if form.validate_on_submit():
+            return response.text('validated')
+        return form.error_response(status=422)
+
+    payload = {
+        'msg': 'love is beautiful',
+        'address-zip': '1234567',
+        'home-city': '12345',
+        'home-zip': '12345',
+        'phones-0': '123',
+        'phones-1': '12345',
+        'tags-0': 'python',
+    }
+    req, resp = app.test_client.post('/', data=payload)
+    assert resp.status == 422
+    assert resp.content_type == 'application/json'
+    assert list(resp.json) == ['errors', 'form_errors']
+    errors = resp.json['errors']
+    assert list(errors) == [
+        'msg', 'address-city', 'address-zip', 'home', 'phones-1', 'tags']
+    assert errors['address-city'] == ['This field is required.']
+    assert errors['home'] == ['city and zip must differ']
+    assert errors['tags'] == ['need 3 tags']
+    assert resp.json['form_errors'] == []